@@ -1,5 +1,6 @@
 import streamlit as st
 from utils.side_bar import add_sidebar_info
+from utils.static_render import render_code
 
 # Page configuration
 st.set_page_config(page_title="Siigma", page_icon="👋🏻", layout="wide")
@@ -25,7 +26,7 @@ st.subheader("🚀 Hello World Example")
 
 st.markdown("Here's the simplest Streamlit app you can create:")
 
-st.code(
+render_code(
     """
 import streamlit as st
 
@@ -1,5 +1,6 @@
 import streamlit as st
 from utils.side_bar import add_sidebar_info
+from utils.static_render import render_code
 
 # Page configuration
 st.set_page_config(page_title="Core Components", page_icon="🎯", layout="wide")
@@ -28,7 +29,7 @@ with col1:
     # Disabled button demo
     st.button("Disabled Button", disabled=True, help="This button is disabled")
 
-    st.code(
+    render_code(
         """
 # Simple button
 if st.button("Click me!"):
@@ -68,7 +69,7 @@ Bob Johnson,35,Chicago"""
         mime="application/json",
     )
 
-    st.code(
+    render_code(
         """
 st.download_button(
     label="Download CSV",
@@ -116,7 +117,7 @@ with st.form("demo_form"):
         else:
             st.error("❌ Please fill in all required fields and agree to terms.")
 
-st.code(
+render_code(
     """
 with st.form("my_form"):
     name = st.text_input("Name")
@@ -230,7 +231,7 @@ with col1:
         if uploaded_file.type == "text/csv":
             import pandas as pd
 
-            df = pd.read_csv(uploaded_file)
+            df = pd.read_csv(uploaded_file, engine="pyarrow", dtype_backend="pyarrow")
             st.dataframe(df.head(), use_container_width=True)
 
 
@@ -291,7 +292,7 @@ with col3:
 
 st.metric("Counter Value", st.session_state.counter)
 
-st.code(
+render_code(
     """
 # Session state example
 if 'counter' not in st.session_state:
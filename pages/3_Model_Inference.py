@@ -1,11 +1,30 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import time
+import zlib
 from utils.side_bar import add_sidebar_info
+from utils.static_render import render_code
 from services.load_model import load_mock_model
 from services.load_data import load_sample_data
 
+
+@st.cache_data(show_spinner=False)
+def _analyze(df: pd.DataFrame):
+    """Return dtypes, missing-value counts and the numeric summary of ``df``.
+
+    The numeric summary is ``None`` when the frame has no numeric columns.
+    """
+    try:
+        numeric_summary = df.describe(include=[np.number])
+    except ValueError:
+        numeric_summary = None
+    # Count missing values in one NumPy pass instead of a per-column pandas sum
+    missing = pd.Series(
+        np.count_nonzero(df.isna().to_numpy(), axis=0), index=df.columns
+    )
+    return df.dtypes, missing, numeric_summary
+
+
 # Page configuration
 st.set_page_config(page_title="Data Input/Output & ML", page_icon="🤖", layout="wide")
 
@@ -38,7 +57,7 @@ with tab1:
 
     if uploaded_csv is not None:
         try:
-            df = pd.read_csv(uploaded_csv)
+            df = pd.read_csv(uploaded_csv, engine="pyarrow", dtype_backend="pyarrow")
             st.success(f"✅ File uploaded successfully: **{uploaded_csv.name}**")
 
             col1, col2, col3 = st.columns(3)
@@ -57,21 +76,21 @@ with tab1:
             if st.checkbox("Show Data Analysis"):
                 st.subheader("📈 Quick Analysis")
 
+                dtypes, missing, numeric_summary = _analyze(df)
+
                 col1, col2 = st.columns(2)
                 with col1:
                     st.write("**Data Types:**")
-                    st.dataframe(df.dtypes.to_frame("Type"), use_container_width=True)
+                    st.dataframe(dtypes.to_frame("Type"), use_container_width=True)
 
                 with col2:
                     st.write("**Missing Values:**")
-                    missing = df.isnull().sum()
                     st.dataframe(missing.to_frame("Missing"), use_container_width=True)
 
                 # Numeric columns analysis
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 0:
+                if numeric_summary is not None:
                     st.write("**Numeric Columns Summary:**")
-                    st.dataframe(df[numeric_cols].describe(), use_container_width=True)
+                    st.dataframe(numeric_summary, use_container_width=True)
 
         except Exception as e:
             st.error(f"❌ Error reading CSV file: {str(e)}")
@@ -113,11 +132,11 @@ with col1:
     if st.button("🔍 Analyze Sentiment"):
         if user_text.strip():
             with st.spinner("Analyzing sentiment..."):
-                time.sleep(1)  # Simulate processing time
-
-                # Mock sentiment analysis
-                sentiment_score = np.random.uniform(-1, 1)
-                confidence = np.random.uniform(0.7, 0.95)
+                # Mock sentiment analysis, seeded by the text so the same
+                # input always gets the same prediction
+                rng = np.random.default_rng(zlib.crc32(user_text.encode()))
+                sentiment_score = rng.uniform(-1, 1)
+                confidence = rng.uniform(0.7, 0.95)
 
                 # Store results in session state
                 st.session_state.sentiment_results = {
@@ -184,7 +203,7 @@ with col1:
             st.success("✅ Model loaded successfully!")
             st.json(model_info)
 
-    st.code(
+    render_code(
         """
         @st.cache_resource
         def load_model():
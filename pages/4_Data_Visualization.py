@@ -1,10 +1,229 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-
 import numpy as np
 from services.load_data import generate_mockup_sales_data
 from utils.side_bar import add_sidebar_info
+from utils.static_render import render_code
+
+
+# The helpers below take hashable primitives and read the (cached) sales data
+# themselves, so the cache key is cheap to build and never hashes a DataFrame.
+@st.cache_data(show_spinner=False)
+def _sales_by_category() -> pd.Series:
+    """Total sales per category, cached so tab switches skip the groupby."""
+    df = generate_mockup_sales_data()
+    return df.groupby("Category", observed=True)["Sales"].sum()
+
+
+@st.cache_data(show_spinner=False)
+def _sales_summary(months: tuple[str, ...]) -> dict:
+    """Headline figures shown in the metrics row, for the selected months."""
+    df = generate_mockup_sales_data()
+    df = df[df["Month"].isin(months)]
+    return {
+        "total_sales": df["Sales"].sum(),
+        "avg_profit": df["Profit"].mean(),
+        "total_products": len(df),
+        "categories": df["Category"].nunique(),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _sorted_by(col: str) -> pd.DataFrame:
+    """Sales data sorted by ``col``, memoized per column."""
+    return generate_mockup_sales_data().sort_values(col)
+
+
+@st.cache_data(show_spinner=False)
+def _grouped_sum(key: str, val: str) -> pd.DataFrame:
+    """Sum of ``val`` per ``key`` as a flat frame, memoized per column pair."""
+    df = generate_mockup_sales_data()
+    return df.groupby(key, observed=True)[val].sum().reset_index()
+
+
+@st.cache_data(show_spinner=False)
+def _line_series() -> pd.DataFrame:
+    """Random-walk time series for the Line Chart demo."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2023-01-01", periods=100)
+    return pd.DataFrame(
+        {"date": dates, "value": np.cumsum(rng.standard_normal(100)) + 100}
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _area_series() -> pd.DataFrame:
+    """Three cumulative series for the Area Chart demo."""
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {
+            "Series A": rng.standard_normal(20).cumsum(),
+            "Series B": rng.standard_normal(20).cumsum(),
+            "Series C": rng.standard_normal(20).cumsum(),
+        }
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _scatter_series() -> pd.DataFrame:
+    """Random points for the Scatter Chart demo."""
+    rng = np.random.default_rng(2)
+    return pd.DataFrame(
+        {
+            "x": rng.standard_normal(50),
+            "y": rng.standard_normal(50),
+            "size": rng.integers(10, 100, 50),
+        }
+    )
+
+
+def _metrics_row(summary: dict, deltas: list):
+    """Metrics Display row."""
+    sales_delta, profit_delta, products_delta = deltas
+    metrics = [
+        ("Total Sales", f"${summary['total_sales']:,.0f}", f"{sales_delta}%"),
+        ("Avg Profit", f"${summary['avg_profit']:,.0f}", f"{profit_delta}%"),
+        ("Total Products", summary["total_products"], f"+{products_delta}"),
+        ("Categories", summary["categories"], None),
+    ]
+    for col, (label, value, delta) in zip(st.columns(4), metrics):
+        col.metric(label, value, delta)
+
+
+# Customizable-chart figures kept per chart type; the least recently used go first
+_MAX_FIGURES = 16
+
+
+# Figure builders only take hashable primitives and read the (cached) sales
+# data themselves, so each figure is built once per set of inputs. They use
+# cache_resource so a hit hands back the same Figure instead of unpickling and
+# re-validating it; the figures are only ever passed to st.plotly_chart, never
+# modified. Plotly is imported inside them so the import is only paid when a
+# figure is built.
+@st.cache_resource(show_spinner=False)
+def _sales_profit_scatter():
+    """Sales vs profit scatter plot for the Advanced Plots tab."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    return px.scatter(
+        df,
+        x="Sales",
+        y="Profit",
+        color="Category",
+        size="Quantity",
+        hover_data=["Product"],
+        title="Sales vs Profit by Category",
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _sales_box_plot():
+    """Sales distribution box plot for the Advanced Plots tab."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    return px.box(df, x="Category", y="Sales", title="Sales Distribution by Category")
+
+
+@st.cache_resource(max_entries=_MAX_FIGURES, show_spinner=False)
+def _build_scatter(x_axis: str | None, y_axis: str, color_by: str | None):
+    """Scatter plot of the selected axes."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    return px.scatter(df, x=x_axis, y=y_axis, color=color_by, hover_data=["Product"])
+
+
+@st.cache_resource(max_entries=_MAX_FIGURES, show_spinner=False)
+def _build_bar(x_axis: str | None, y_axis: str, color_by: str | None):
+    """Bar chart; aggregated per category when Category is on the x-axis."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    if x_axis == "Category":
+        return px.bar(_grouped_sum("Category", y_axis), x="Category", y=y_axis)
+    return px.bar(df.head(10), x="Product", y=y_axis, color=color_by)
+
+
+@st.cache_resource(max_entries=_MAX_FIGURES, show_spinner=False)
+def _build_line(x_axis: str | None, y_axis: str, color_by: str | None):
+    """Line chart over the sorted x-axis, or per category."""
+    import plotly.express as px
+
+    if x_axis in ["Sales", "Profit", "Quantity"]:
+        # Sort by x_axis for line chart
+        sorted_df = _sorted_by(x_axis)
+        return px.line(sorted_df, x=x_axis, y=y_axis, color=color_by)
+    return px.line(_grouped_sum("Category", y_axis), x="Category", y=y_axis)
+
+
+@st.cache_resource(max_entries=_MAX_FIGURES, show_spinner=False)
+def _build_box(x_axis: str | None, y_axis: str, color_by: str | None):
+    """Box plot of the selected metric per category."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    return px.box(df, x="Category", y=y_axis)
+
+
+@st.cache_resource(max_entries=_MAX_FIGURES, show_spinner=False)
+def _build_hist(x_axis: str | None, y_axis: str, color_by: str | None):
+    """Histogram of the selected metric."""
+    import plotly.express as px
+
+    df = generate_mockup_sales_data()
+    return px.histogram(df, x=y_axis, color=color_by)
+
+
+# Customizable chart builders, keyed by the "Chart Type" selection
+CHART_BUILDERS = {
+    "scatter": _build_scatter,
+    "bar": _build_bar,
+    "line": _build_line,
+    "box": _build_box,
+    "histogram": _build_hist,
+}
+
+
+def _chart_args(chart_type: str, x_axis: str, y_axis: str, color_by: str | None):
+    """Set the inputs a chart ignores to None, so each figure is cached once."""
+    if chart_type == "box":
+        return None, y_axis, None
+    if chart_type == "histogram":
+        return None, y_axis, color_by
+    if chart_type == "bar" and x_axis != "Category":
+        # Top products by name; the x-axis only picks this branch
+        return None, y_axis, color_by
+    if chart_type in ("bar", "line") and x_axis == "Category":
+        # Aggregated per category, drawn without color
+        return x_axis, y_axis, None
+    return x_axis, y_axis, color_by
+
+
+@st.fragment
+def _customizable_chart():
+    """Chart controls and plot; changing a control reruns only this section."""
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        chart_type = st.selectbox("Chart Type", list(CHART_BUILDERS))
+
+    with col2:
+        x_axis = st.selectbox("X-Axis", ["Sales", "Profit", "Quantity", "Category"])
+
+    with col3:
+        y_axis = st.selectbox("Y-Axis", ["Profit", "Sales", "Quantity"], index=0)
+
+    # Color option
+    color_by = st.selectbox("Color By", [None, "Category", "Product"], index=1)
+
+    # Create the chart based on selections
+    args = _chart_args(chart_type, x_axis, y_axis, color_by)
+    fig = CHART_BUILDERS[chart_type](*args)
+
+    st.plotly_chart(fig, use_container_width=True)
+
 
 # Page configuration
 st.set_page_config(
@@ -41,15 +260,11 @@ with tab1:
 
     with col1:
         st.subheader("Line Chart")
-        # Create time series data
-        dates = pd.date_range("2023-01-01", periods=100)
-        time_series = pd.DataFrame(
-            {"date": dates, "value": np.cumsum(np.random.randn(100)) + 100}
-        )
+        time_series = _line_series()
         st.line_chart(time_series.set_index("date"))
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -64,10 +279,10 @@ st.line_chart(time_series.set_index('date'))
 
     with col2:
         st.subheader("Bar Chart")
-        st.bar_chart(df.groupby("Category")["Sales"].sum())
+        st.bar_chart(_sales_by_category())
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 # Assuming df is your DataFrame
 st.bar_chart(df.groupby('Category')['Sales'].sum())
             """)
@@ -76,17 +291,11 @@ st.bar_chart(df.groupby('Category')['Sales'].sum())
 
     with col3:
         st.subheader("Area Chart")
-        area_data = pd.DataFrame(
-            {
-                "Series A": np.random.randn(20).cumsum(),
-                "Series B": np.random.randn(20).cumsum(),
-                "Series C": np.random.randn(20).cumsum(),
-            }
-        )
+        area_data = _area_series()
         st.area_chart(area_data)
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 area_data = pd.DataFrame({
     'Series A': np.random.randn(20).cumsum(),
     'Series B': np.random.randn(20).cumsum(),
@@ -97,17 +306,11 @@ st.area_chart(area_data)
 
     with col4:
         st.subheader("Scatter Chart")
-        scatter_data = pd.DataFrame(
-            {
-                "x": np.random.randn(50),
-                "y": np.random.randn(50),
-                "size": np.random.randint(10, 100, 50),
-            }
-        )
+        scatter_data = _scatter_series()
         st.scatter_chart(scatter_data, x="x", y="y", size="size")
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 scatter_data = pd.DataFrame({
     'x': np.random.randn(50),
     'y': np.random.randn(50),
@@ -124,19 +327,11 @@ with tab2:
 
     with col1:
         st.subheader("Interactive Scatter Plot")
-        fig_scatter = px.scatter(
-            df,
-            x="Sales",
-            y="Profit",
-            color="Category",
-            size="Quantity",
-            hover_data=["Product"],
-            title="Sales vs Profit by Category",
-        )
+        fig_scatter = _sales_profit_scatter()
         st.plotly_chart(fig_scatter, use_container_width=True)
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 import plotly.express as px
 
 fig = px.scatter(
@@ -153,13 +348,11 @@ st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.subheader("Box Plot")
-        fig_box = px.box(
-            df, x="Category", y="Sales", title="Sales Distribution by Category"
-        )
+        fig_box = _sales_box_plot()
         st.plotly_chart(fig_box, use_container_width=True)
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 fig = px.box(
     df, 
     x='Category', 
@@ -174,8 +367,14 @@ with tab3:
     st.header("Data Display Components")
     st.markdown("Various ways to display and interact with tabular data.")
 
-    # Add Month column
-    df["Month"] = pd.to_datetime(df["Order_Date"]).dt.strftime("%B")
+    # Pin the demo metric deltas so they stay put across reruns
+    if "metric_deltas" not in st.session_state:
+        rng = np.random.default_rng(0)
+        st.session_state.metric_deltas = [
+            int(rng.integers(-10, 10)),
+            int(rng.integers(-5, 15)),
+            int(rng.integers(1, 10)),
+        ]
 
     # Add month filter
     months = (
@@ -212,7 +411,7 @@ with tab3:
         st.table(filtered_df.head())
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 # Static table display
 st.table(df.head())
             """)
@@ -222,7 +421,7 @@ st.table(df.head())
         st.dataframe(filtered_df, use_container_width=True)
 
         with st.expander("💡 Code Example"):
-            st.code("""
+            render_code("""
 # Interactive dataframe with sorting, filtering
 st.dataframe(df, use_container_width=True)
             """)
@@ -230,8 +429,8 @@ st.dataframe(df, use_container_width=True)
     st.subheader("Data Editor")
     st.markdown("Allow users to edit data directly in the interface:")
 
-    # Create a smaller editable dataset
-    editable_df = filtered_df.head(5).copy()
+    # st.data_editor copies its input, so a positional slice is enough here
+    editable_df = filtered_df.iloc[:5]
     edited_df = st.data_editor(
         editable_df,
         use_container_width=True,
@@ -243,7 +442,7 @@ st.dataframe(df, use_container_width=True)
         st.json(edited_df.to_dict())
 
     with st.expander("💡 Code Example"):
-        st.code("""
+        render_code("""
 # Editable data interface
 edited_df = st.data_editor(
     df,
@@ -253,36 +452,11 @@ edited_df = st.data_editor(
         """)
 
     st.subheader("Metrics Display")
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric(
-            label="Total Sales",
-            value=f"${filtered_df['Sales'].sum():,.0f}",
-            delta=f"{np.random.randint(-10, 10)}%",
-        )
-
-    with col2:
-        st.metric(
-            label="Avg Profit",
-            value=f"${filtered_df['Profit'].mean():,.0f}",
-            delta=f"{np.random.randint(-5, 15)}%",
-        )
-
-    with col3:
-        st.metric(
-            label="Total Products",
-            value=len(filtered_df),
-            delta=f"+{np.random.randint(1, 10)}",
-        )
-
-    with col4:
-        st.metric(
-            label="Categories", value=filtered_df["Category"].nunique(), delta=None
-        )
+    summary = _sales_summary(tuple(selected_months))
+    _metrics_row(summary, st.session_state.metric_deltas)
 
     with st.expander("💡 Code Example"):
-        st.code("""
+        render_code("""
 st.metric(
     label="Total Sales",
     value=f"${df['Sales'].sum():,.0f}",
@@ -295,52 +469,10 @@ st.metric(
     st.write(df.columns)
     # Interactive chart controls
     st.subheader("Customizable Chart")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        chart_type = st.selectbox(
-            "Chart Type", ["scatter", "bar", "line", "box", "histogram"]
-        )
-
-    with col2:
-        x_axis = st.selectbox("X-Axis", ["Sales", "Profit", "Quantity", "Category"])
-
-    with col3:
-        y_axis = st.selectbox("Y-Axis", ["Profit", "Sales", "Quantity"], index=0)
-
-    # Color option
-    color_by = st.selectbox("Color By", [None, "Category", "Product"], index=1)
-
-    # Create the chart based on selections
-    if chart_type == "scatter":
-        fig = px.scatter(df, x=x_axis, y=y_axis, color=color_by, hover_data=["Product"])
-    elif chart_type == "bar":
-        if x_axis == "Category":
-            agg_df = df.groupby("Category")[y_axis].sum().reset_index()
-            fig = px.bar(agg_df, x="Category", y=y_axis)
-        else:
-            fig = px.bar(df.head(10), x="Product", y=y_axis, color=color_by)
-    elif chart_type == "line":
-        if x_axis in ["Sales", "Profit", "Quantity"]:
-            # Sort by x_axis for line chart
-            sorted_df = df.sort_values(x_axis)
-            fig = px.line(sorted_df, x=x_axis, y=y_axis, color=color_by)
-        else:
-            fig = px.line(
-                df.groupby("Category")[y_axis].sum().reset_index(),
-                x="Category",
-                y=y_axis,
-            )
-    elif chart_type == "box":
-        fig = px.box(df, x="Category", y=y_axis)
-    elif chart_type == "histogram":
-        fig = px.histogram(df, x=y_axis, color=color_by)
-
-    st.plotly_chart(fig, use_container_width=True)
+    _customizable_chart()
 
     with st.expander("💡 Code Example"):
-        st.code("""
+        render_code("""
 # Interactive chart with user controls
 chart_type = st.selectbox("Chart Type", ["scatter", "bar", "line"])
 x_axis = st.selectbox("X-Axis", df.columns)
@@ -1,11 +1,7 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import time
-from datetime import datetime
-from services.load_data import generate_mockup_sales_data, load_sample_data
-from services.load_model import load_mock_model
-from utils.side_bar import add_sidebar_info
+from utils.caching_demo_common import CACHING_EXAMPLES
+from utils.side_bar import add_sidebar_info, render_cache_stats
+from utils.static_render import render_code
 
 # Page configuration
 st.set_page_config(
@@ -20,356 +16,63 @@ Learn how to optimize your Streamlit apps with powerful caching mechanisms for b
 Streamlit provides several caching decorators to help you cache expensive computations, data loading, and resources.
 """)
 
-# Initialize session state for tracking function calls
-if "call_count" not in st.session_state:
-    st.session_state.call_count = 0
-if "cached_call_count" not in st.session_state:
-    st.session_state.cached_call_count = 0
-
-# Tabs for different caching topics
-tab1, tab2, tab3 = st.tabs(
-    [
-        "🎯 Caching Basics",
-        "📊 @st.cache_data",
-        "🎨 @st.cache_resource",
-    ]
-)
-
-with tab1:
-    st.header("Caching Basics")
-    st.markdown("""
-    Caching in Streamlit helps avoid expensive computations by storing results and reusing them when inputs haven't changed.
-    This dramatically improves app performance and user experience.
-    """)
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("Why Cache?")
-        st.markdown("""
-        **Without caching:**
-        - Functions run every time the app reruns
-        - Expensive operations repeat unnecessarily
-        - Poor user experience with long wait times
-        - Higher computational costs
-        
-        **With caching:**
-        - Results stored and reused when possible
-        - Faster app responses
-        - Better resource utilization
-        - Improved user satisfaction
-        """)
-
-    with col2:
-        st.subheader("When to Use Caching")
-        st.markdown("""
-        **Perfect for caching:**
-        - Data loading from files/databases
-        - API calls and web requests
-        - Machine learning model training
-        - Complex data transformations
-        - Expensive computations
-        
-        **Avoid caching:**
-        - Functions with side effects
-        - Non-deterministic operations
-        - Functions returning different results for same inputs
-        """)
-
-    st.subheader("Types of Caching in Streamlit")
-
-    cache_info = {
-        "Decorator": [
-            "@st.cache_data",
-            "@st.cache_resource",
-        ],
-        "Use Case": [
-            "Data processing, DataFrames, serializable objects",
-            "ML models, database connections, non-serializable objects",
-        ],
-        "Serializable": ["Yes", "No"],
-    }
-
-    st.table(pd.DataFrame(cache_info))
-
-    with st.expander("💡 Basic Caching Example"):
-        st.code("""
-import streamlit as st
-import time
-
-# Without caching - runs every time
-def slow_function_no_cache(n):
-    time.sleep(2)  # Simulate expensive operation
-    return sum(range(n))
-
-# With caching - runs once per unique input
-@st.cache_data
-def slow_function_cached(n):
-    time.sleep(2)  # Simulate expensive operation
-    return sum(range(n))
-
-# Usage
-result = slow_function_cached(1000)  # First call: takes 2 seconds
-result = slow_function_cached(1000)  # Subsequent calls: instant!
-        """)
-
-with tab2:
-    st.header("@st.cache_data Deep Dive")
-    st.markdown("""
-    `@st.cache_data` is used for caching data transformations, DataFrames, and other serializable objects.
-    It's the most commonly used caching decorator in Streamlit apps.
-    """)
+st.header("🎯 Caching Basics")
+st.markdown("""
+Caching in Streamlit helps avoid expensive computations by storing results and reusing them when inputs haven't changed.
+This dramatically improves app performance and user experience.
+""")
 
-    # Example 1: Basic data caching
-    st.subheader("1. Basic Data Caching")
+col1, col2 = st.columns(2)
 
+with col1:
+    st.subheader("Why Cache?")
     st.markdown("""
-    Demonstrating cached data loading from our services module.
+    **Without caching:**
+    - Functions run every time the app reruns
+    - Expensive operations repeat unnecessarily
+    - Poor user experience with long wait times
+    - Higher computational costs
+    
+    **With caching:**
+    - Results stored and reused when possible
+    - Faster app responses
+    - Better resource utilization
+    - Improved user satisfaction
     """)
 
-    if st.button("Load Sample Data", key="load_sample_data"):
-        with st.spinner("Loading data from external source..."):
-            start_time = time.time()
-            data = load_sample_data()
-            end_time = time.time()
-
-            st.success(f"📊 Data loaded in {end_time - start_time:.2f} seconds")
-            st.write(f"📈 Dataset shape: {data.shape}")
-            st.dataframe(data.head())
-
-            # Show subsequent calls are instant
-            if st.button("Reload Same Data (Should be instant)", key="reload_data"):
-                start_time = time.time()
-                data_cached = load_sample_data()
-                end_time = time.time()
-                st.info(
-                    f"⚡ Cached data retrieved in {end_time - start_time:.3f} seconds"
-                )
-    # Example 2: Data loading with parameters
-    st.subheader("2. Parameterized Data Loading")
-
+with col2:
+    st.subheader("When to Use Caching")
     st.markdown("""
-    Using our actual data generation service with caching to demonstrate
-    how service functions can be cached with different parameters.
+    **Perfect for caching:**
+    - Data loading from files/databases
+    - API calls and web requests
+    - Machine learning model training
+    - Complex data transformations
+    - Expensive computations
+    
+    **Avoid caching:**
+    - Functions with side effects
+    - Non-deterministic operations
+    - Functions returning different results for same inputs
     """)
 
-    @st.cache_data
-    def load_filtered_data(category_filter, min_sales):
-        """Simulate loading and filtering data using our service"""
-        time.sleep(0.5)  # Simulate database query
-        df = generate_mockup_sales_data()
-        filtered_df = df[
-            (df["Category"] == category_filter) & (df["Sales"] >= min_sales)
-        ]
-        return filtered_df
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        category = st.selectbox(
-            "Category Filter",
-            ["Electronics", "Office Supplies", "Furniture"],
-            key="cache_category",
-        )
-
-    with col2:
-        min_sales = st.slider("Minimum Sales", 0, 5000, 1000, key="cache_min_sales")
-
-    # This will be cached based on the combination of parameters
-    if st.button("Load Filtered Data"):
-        start_time = time.time()
-        filtered_data = load_filtered_data(category, min_sales)
-        end_time = time.time()
-
-        st.write(f"⏱️ Query time: {end_time - start_time:.3f} seconds")
-        st.write(f"📊 Found {len(filtered_data)} records")
-        st.dataframe(filtered_data)
-
-    # Example 3: Cache configuration options
-    st.subheader("3. Cache Configuration")
+st.subheader("Types of Caching in Streamlit")
 
-    @st.cache_data(
-        ttl=30,
-        max_entries=5,
-        show_spinner="Loading data...",
-    )
-    def configurable_cache_example(data_type):
-        time.sleep(1)
-        if data_type == "random":
-            return pd.DataFrame(np.random.rand(100, 3), columns=["X", "Y", "Z"])
-        elif data_type == "sequential":
-            return pd.DataFrame(
-                {"X": range(100), "Y": range(100, 200), "Z": range(200, 300)}
-            )
-        else:
-            return pd.DataFrame({"X": [1, 2, 3], "Y": [4, 5, 6], "Z": [7, 8, 9]})
-
-    st.markdown("**Cache with TTL (Time To Live) and Entry Limits:**")
-
-    data_type = st.selectbox(
-        "Data Type", ["random", "sequential", "simple"], key="config_data_type"
-    )
+st.markdown("""
+| Decorator | Use Case | Serializable |
+|---|---|---|
+| `@st.cache_data` | Data processing, DataFrames, serializable objects | Yes |
+| `@st.cache_resource` | ML models, database connections, non-serializable objects | No |
+""")
 
-    if st.button("Load with Configured Cache"):
-        result = configurable_cache_example(data_type)
-        st.dataframe(result.head())
-        st.info("This cache expires after 30 seconds and keeps max 5 entries")
+with st.expander("💡 Basic Caching Example"):
+    render_code(CACHING_EXAMPLES["basic"])
 
-    with st.expander("💡 Configuration Options"):
-        st.code("""
-@st.cache_data(
-    ttl=300,                    # Cache expires after 5 minutes
-    max_entries=10,             # Keep maximum 10 cache entries
-    show_spinner="Loading...",  # Custom loading message
+st.subheader("Continue the Deep Dive")
+st.page_link("pages/6_Cache_Data.py", label="@st.cache_data Deep Dive", icon="📊")
+st.page_link(
+    "pages/7_Cache_Resource.py", label="@st.cache_resource Deep Dive", icon="🎨"
 )
-def my_cached_function(param):
-    # Your expensive operation here
-    return result
-        """)
-
-with tab3:
-    st.header("@st.cache_resource Deep Dive")
-    st.markdown("""
-    `@st.cache_resource` is used for caching non-serializable objects like ML models, database connections,
-    and other resources that shouldn't be recreated on every run.
-    """)
-
-    # Example 1: ML Model Caching
-    st.subheader("1. Machine Learning Model Caching")
-
-    st.markdown("""
-    Using the actual model loading function from our services module to demonstrate 
-    real-world caching scenarios.
-    """)
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        if st.button("Load Model (First Time)", key="load_model_first"):
-            with st.spinner(
-                "Loading model... (this may take a few seconds on first load)"
-            ):
-                start_time = time.time()
-                model = load_mock_model()
-                end_time = time.time()
-
-                st.success(f"✅ Model loaded in {end_time - start_time:.2f} seconds")
-                st.json(model)
-
-    with col2:
-        if st.button("Load Model (Cached)", key="load_model_cached"):
-            with st.spinner("Loading model..."):
-                start_time = time.time()
-                model = load_mock_model()
-                end_time = time.time()
-
-                st.success(f"⚡ Model retrieved in {end_time - start_time:.3f} seconds")
-                st.json(model)
-
-    st.divider()
-    # Example 2: Database Connection Caching
-    st.subheader("2. Database Connection Simulation")
-
-    from services.mock_db import MockDatabase
-
-    def is_db_connect(db: MockDatabase):
-        """Check if the database connection is valid"""
-        return db is not None and db.connection_time is not None
-
-    @st.cache_resource(validate=is_db_connect)
-    def get_database_connection(db_url):
-        """Create and cache database connection"""
-        return MockDatabase(db_url)
-
-    db_url = st.text_input(
-        "Database URL", value="postgresql://localhost:5432/mydb", key="db_url"
-    )
-
-    db = get_database_connection(db_url)
-    if st.button("Connect to Database"):
-        try:
-            start_time = time.time()
-            db.connect()
-            end_time = time.time()
-            st.success(f"✅ Connected in {end_time - start_time:.5f} seconds")
-            st.write(f"🔗 {db}")
-            st.write(f"⏰ Connection established at: {db.connection_time}")
-        except Exception as e:
-            st.error(f"❌ Connection failed: {str(e)}")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("Run Query"):
-            try:
-                result = db.query("SELECT * FROM sample_table LIMIT 10")
-                st.dataframe(result)
-            except ValueError as e:
-                st.error(f"❌ Query failed: {str(e)}")
-
-    with col2:
-        if st.button("Disconnect Database"):
-            db.close()
-            st.warning("🔌 Database disconnected!")
-            st.write(f"🔗 {db}")
-
-    with st.expander("💡 Code Example"):
-        st.code("""
-@st.cache_resource
-def get_database_connection(connection_string):
-    # Connection created once and reused
-    conn = psycopg2.connect(connection_string)
-    return conn
-
-# Connection is established once
-db = get_database_connection("postgresql://localhost/mydb")
-result = db.execute("SELECT * FROM users")
-        """)
-
-    st.divider()
-
-    # Example 3: Cache Management
-    st.subheader("3. Cache Management")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        if st.button("Clear All Caches"):
-            st.cache_data.clear()
-            st.cache_resource.clear()
-            st.success("✅ All caches cleared!")
-
-    with col2:
-        if st.button("Clear Data Cache"):
-            load_sample_data.clear()
-            st.cache_data.clear()
-            st.success("✅ Data cache cleared!")
-
-    with col3:
-        if st.button("Clear Resource Cache"):
-            load_mock_model.clear()
-            st.cache_resource.clear()
-            st.success("✅ Model cache cleared!")
-
-    with st.expander("💡 Cache Management"):
-        st.code("""
-# Clear all cache types
-st.cache_data.clear()     # Clear all @st.cache_data caches
-st.cache_resource.clear() # Clear all @st.cache_resource caches
-
-# Clear specific service function caches
-from services.load_data import load_sample_data
-from services.load_model import load_mock_model
-
-load_sample_data.clear()  # Clear specific data loading cache
-load_mock_model.clear()   # Clear specific model loading cache
-
-# Programmatic cache invalidation
-@st.cache_data
-def get_user_data(user_id, _force_refresh=False):
-    if _force_refresh:
-        get_user_data.clear()  # Clear this function's cache
-    return load_user_data(user_id)
-        """)
 
 st.divider()
 # Best Practices section
@@ -494,6 +197,5 @@ with st.expander("⚡ Performance Optimization Tips"):
     ```
     """)
 
-st.success(
-    "🎉 Congratulations! You've completed the Streamlit Demo App. You now have a comprehensive understanding of Streamlit's core features, from basic components to advanced caching strategies."
-)
+# Render last so the table reflects the cached calls made above
+render_cache_stats()
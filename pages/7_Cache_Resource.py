@@ -0,0 +1,155 @@
+import streamlit as st
+import time
+from services import byte_cache
+from services.cache_demo import get_database_connection, run_query
+from services.load_data import load_sample_data
+from services.load_model import load_mock_model
+from utils.caching_demo_common import CACHING_EXAMPLES
+from utils.side_bar import add_sidebar_info, render_cache_stats
+from utils.static_render import render_code
+
+# Page configuration
+st.set_page_config(
+    page_title="@st.cache_resource - Streamlit Demo", page_icon="🎨", layout="centered"
+)
+
+add_sidebar_info()
+
+st.title("🎨 @st.cache_resource Deep Dive")
+st.markdown("""
+`@st.cache_resource` is used for caching non-serializable objects like ML models, database connections,
+and other resources that shouldn't be recreated on every run.
+""")
+
+# Example 1: ML Model Caching
+st.subheader("1. Machine Learning Model Caching")
+
+st.markdown("""
+Using the actual model loading function from our services module to demonstrate 
+real-world caching scenarios.
+""")
+
+
+@st.fragment
+def _model_section():
+    """Model load buttons; clicks rerun only this section"""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("Load Model (First Time)", key="load_model_first"):
+            with st.spinner(
+                "Loading model... (this may take a few seconds on first load)"
+            ):
+                t0 = time.perf_counter_ns()
+                model = load_mock_model()
+                elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+
+                st.success(f"✅ Model loaded in {elapsed_ms:.3f} ms")
+                st.json(model)
+
+    with col2:
+        if st.button("Load Model (Cached)", key="load_model_cached"):
+            with st.spinner("Loading model..."):
+                t0 = time.perf_counter_ns()
+                model = load_mock_model()
+                elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+
+                st.success(f"⚡ Model retrieved in {elapsed_ms:.3f} ms")
+                st.json(model)
+
+
+_model_section()
+
+st.divider()
+# Example 2: Database Connection Caching
+st.subheader("2. Database Connection Simulation")
+
+
+@st.fragment
+def _database_section():
+    """Database demo; widget changes rerun only this section"""
+    db_url = st.text_input(
+        "Database URL", value="postgresql://localhost:5432/mydb", key="db_url"
+    )
+
+    # Cached: the connection is only opened once per URL and then reused
+    t0 = time.perf_counter_ns()
+    db = get_database_connection(db_url)
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+    st.write(f"🔗 {db} (retrieved in {elapsed_ms:.3f} ms)")
+    st.write(f"⏰ Connection established at: {db.connection_time}")
+    st.caption(
+        "Disconnecting fails the cache's `validate` check, so the next rerun "
+        "opens a fresh connection."
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Run Query"):
+            try:
+                result = run_query(db_url, "SELECT * FROM sample_table LIMIT 10")
+                st.dataframe(result)
+                st.caption("Query results are cached with `@st.cache_data(ttl=60)`.")
+            except ValueError as e:
+                st.error(f"❌ Query failed: {str(e)}")
+
+    with col2:
+        if st.button("Disconnect Database"):
+            db.close()
+            st.warning("🔌 Database disconnected!")
+            st.write(f"🔗 {db}")
+
+
+_database_section()
+
+with st.expander("💡 Code Example"):
+    render_code(CACHING_EXAMPLES["db_connection"])
+
+st.divider()
+
+# Example 3: Cache Management
+st.subheader("3. Cache Management")
+
+
+@st.fragment
+def _cache_management_section():
+    """Cache clearing buttons; clicks rerun only this section"""
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("Clear All Caches"):
+            # Also drops the sample data's Parquet files, which outlive cache_data
+            load_sample_data.clear()
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            # The mock data generators use byte_cached, out of st.*.clear()'s reach
+            byte_cache.clear_all()
+            st.success("✅ All caches cleared!")
+
+    with col2:
+        if st.button("Clear Data Cache"):
+            load_sample_data.clear()
+            st.cache_data.clear()
+            byte_cache.clear_all()
+            st.success("✅ Data cache cleared!")
+
+    with col3:
+        if st.button("Clear Resource Cache"):
+            load_mock_model.clear()
+            st.cache_resource.clear()
+            st.success("✅ Model cache cleared!")
+
+
+_cache_management_section()
+
+with st.expander("💡 Cache Management"):
+    render_code(CACHING_EXAMPLES["cache_management"])
+
+st.divider()
+
+st.success(
+    "🎉 Congratulations! You've completed the Streamlit Demo App. You now have a comprehensive understanding of Streamlit's core features, from basic components to advanced caching strategies."
+)
+
+# Render last so the table reflects the cached calls made above
+render_cache_stats()
@@ -0,0 +1,134 @@
+import functools
+import inspect
+import threading
+import weakref
+from collections import OrderedDict
+from services.cache_stats import sizeof
+
+# Registry of every byte_cached function, for get_stats()
+_CACHES: dict[str, "ByteLRU"] = {}
+
+# Size of the value this thread last stored, for observed_cache to reuse
+_last_miss = threading.local()
+
+
+def _freeze(value):
+    """Turn list/dict arguments into hashable equivalents for the cache key"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+class ByteLRU(OrderedDict):
+    """LRU mapping that evicts by total size in bytes rather than entry count"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Guards the mapping itself; computing a value takes a per-key lock
+        self.lock = threading.Lock()
+        # Weak values, so a key's lock goes away once no caller holds it
+        self.key_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._sizes: dict = {}
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def put(self, key, value) -> int:
+        """Store ``value`` under ``key`` and return its size in bytes"""
+        size = sizeof(value)
+        if key in self:
+            del self[key]
+        # Values bigger than the whole budget are returned but never stored
+        if size > self.max_bytes:
+            return size
+        while self.total_bytes + size > self.max_bytes:
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
+        self._sizes[key] = size
+        self.total_bytes += size
+        return size
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.total_bytes -= self._sizes.pop(key)
+
+    def clear(self):
+        super().clear()
+        self._sizes.clear()
+        self.key_locks.clear()
+        self.total_bytes = 0
+
+
+def byte_cached(max_bytes: int = 256 * 1024 * 1024):
+    """Cache a function's results in a shared LRU capped at ``max_bytes``.
+
+    Like ``st.cache_resource``, every caller gets the same shared object, so
+    returned DataFrames must not be mutated in place.
+    """
+
+    def decorator(func):
+        cache = _CACHES[f"{func.__module__}.{func.__qualname__}"] = ByteLRU(max_bytes)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _freeze(tuple(bound.arguments.items()))
+            with cache.lock:
+                if key in cache:
+                    cache.hits += 1
+                    return cache[key]
+                key_lock = cache.key_locks.get(key)
+                if key_lock is None:
+                    key_lock = cache.key_locks[key] = threading.Lock()
+
+            # Like st.cache_resource, a per-key lock makes concurrent sessions
+            # build a value once without blocking hits on other keys
+            with key_lock:
+                with cache.lock:
+                    if key in cache:
+                        cache.hits += 1
+                        return cache[key]
+                    cache.misses += 1
+                value = func(*args, **kwargs)
+                with cache.lock:
+                    _last_miss.size = cache.put(key, value)
+                return value
+
+        def clear():
+            with cache.lock:
+                cache.clear()
+
+        wrapper.clear = clear
+        # Lets observed_cache report the size without measuring the value again
+        wrapper.last_miss_size = lambda: _last_miss.size
+        return wrapper
+
+    return decorator
+
+
+def clear_all():
+    """Empty the cache of every byte_cached function"""
+    for cache in _CACHES.values():
+        with cache.lock:
+            cache.clear()
+
+
+def get_stats() -> dict[str, tuple[int, int, int]]:
+    """Return ``{module.qualname: (bytes, hits, misses)}`` for byte_cached functions"""
+    return {
+        name: (cache.total_bytes, cache.hits, cache.misses)
+        for name, cache in _CACHES.items()
+    }
@@ -0,0 +1,85 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from services.cache_stats import observed_cache
+from services.load_data import generate_mockup_sales_data
+from services.mock_db import MockDatabase
+
+
+@st.cache_resource(show_spinner=False)
+def _sales_by_category():
+    """Sales data split per category, each sorted by Sales for binary search"""
+    df = generate_mockup_sales_data()
+    return {
+        category: group.sort_values("Sales").reset_index(drop=True)
+        for category, group in df.groupby("Category", observed=True)
+    }
+
+
+def load_filtered_data(category_filter, min_sales):
+    """Load and filter data using our service.
+
+    The per-category views are built once and shared; each query is a binary
+    search on the sorted Sales column and returns a slice of that view.
+    """
+    view = _sales_by_category().get(category_filter)
+    if view is None:
+        return generate_mockup_sales_data().iloc[:0]
+    start = view["Sales"].searchsorted(min_sales)
+    return view.iloc[start:]
+
+
+# Constant result for the "simple" case, built once at import
+_SIMPLE_DF = pd.DataFrame({"X": [1, 2, 3], "Y": [4, 5, 6], "Z": [7, 8, 9]})
+
+
+@st.cache_data(
+    ttl=30,
+    max_entries=5,
+    show_spinner="Loading data...",
+)
+def configurable_cache_example(data_type: str, seed: int = 0):
+    """Return a small demo frame for the given data type.
+
+    All randomness comes from a generator seeded by the ``seed`` argument, so
+    the function stays a pure function of its inputs, as cached functions
+    should be.
+    """
+    rng = np.random.default_rng(seed)
+    # Real compute-bound work (a 512x512 SVD) stands in for an expensive step
+    m = rng.standard_normal((512, 512), dtype=np.float32)
+    np.linalg.svd(m, compute_uv=False)
+    if data_type == "random":
+        data = rng.random((100, 3), dtype=np.float32)
+        return pd.DataFrame(data, columns=["X", "Y", "Z"], copy=False)
+    elif data_type == "sequential":
+        # One contiguous allocation; column k holds 100*k .. 100*k + 99
+        data = np.arange(300, dtype=np.int32).reshape(3, 100).T
+        return pd.DataFrame(data, columns=["X", "Y", "Z"], copy=False)
+    else:
+        return _SIMPLE_DF
+
+
+def is_db_connect(db: MockDatabase):
+    """Check if the database connection is valid"""
+    # Runs on every cache hit, so keep it to a single attribute read
+    return db.connected
+
+
+@observed_cache(st.cache_resource(validate=is_db_connect))
+def get_database_connection(db_url):
+    """Create and cache database connection.
+
+    To cache a function that takes the connection itself as an argument, key
+    it on its URL with ``hash_funcs={MockDatabase: lambda db: db.db_url}``, or
+    name the parameter ``_db`` so Streamlit leaves it out of the key. Don't
+    hash by ``id()``: ids are reused once an object is garbage collected.
+    """
+    return MockDatabase(db_url)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def run_query(db_url, sql):
+    """Run a query on the cached connection; results are reused for 60 seconds"""
+    return get_database_connection(db_url).query(sql)
@@ -0,0 +1,71 @@
+import functools
+import sys
+import threading
+import time
+import pandas as pd
+
+# Per-function counters recorded by observed_cache, keyed by module.qualname
+_STATS: dict[str, dict] = {}
+
+
+def sizeof(value) -> int:
+    """Memory footprint of a cached value in bytes"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+def observed_cache(cache_decorator):
+    """Apply ``cache_decorator`` and record hits, misses, latency and size.
+
+    The undecorated function only runs on a miss, in the caller's thread, so it
+    flags the call as a miss; any call left unflagged was a hit. New values are
+    measured once, reusing the size ``byte_cached`` already computed when the
+    cache provides ``last_miss_size``.
+    Usage: ``@observed_cache(st.cache_data(ttl=60))``.
+    """
+
+    def decorator(func):
+        stats = _STATS[f"{func.__module__}.{func.__qualname__}"] = {
+            "hits": 0,
+            "misses": 0,
+            "last_ms": 0.0,
+            "bytes": 0,
+        }
+        lock = threading.Lock()
+        call = threading.local()
+
+        @functools.wraps(func)
+        def counted(*args, **kwargs):
+            call.missed = True
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(counted)
+        measured_size = getattr(cached, "last_miss_size", None)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            call.missed = False
+            t0 = time.perf_counter_ns()
+            result = cached(*args, **kwargs)
+            elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+            if call.missed:
+                size = measured_size() if measured_size else sizeof(result)
+            with lock:
+                stats["last_ms"] = elapsed_ms
+                if call.missed:
+                    stats["misses"] += 1
+                    stats["bytes"] = size
+                else:
+                    stats["hits"] += 1
+            return result
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorator
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """Return a snapshot of ``{module.qualname: {hits, misses, last_ms, bytes}}``"""
+    return {name: dict(stats) for name, stats in _STATS.items()}
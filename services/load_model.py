@@ -1,9 +1,14 @@
 import streamlit as st
 import time
+from services.cache_stats import observed_cache
 
 
-@st.cache_resource
+@observed_cache(st.cache_resource(max_entries=1, show_spinner=False))
 def load_mock_model():
-    """Simulate loading an ML model"""
+    """Simulate loading an ML model.
+
+    st.cache_resource takes a per-key lock around the first call, so sessions
+    arriving together wait for one load instead of each sleeping.
+    """
     time.sleep(3)  # Simulate loading time
     return {"model_name": "Sentiment Analyzer", "version": "1.0", "accuracy": 0.87}
@@ -19,16 +19,19 @@ class MockDatabase:
         self.connected = True
         self.connection_time = datetime.now()
 
-    def query(self, sql):
+    def query(self, sql, simulated_latency=0.0):
         if not self.connected:
             raise ValueError("Database not connected!")
         # Simulate query execution
-        time.sleep(0.1)
+        if simulated_latency:
+            time.sleep(simulated_latency)
         return pd.DataFrame(
             {
-                "id": range(10),
-                "value": np.random.rand(10),
-                "timestamp": [datetime.now().strftime("%Y-%m-%d %H:%M:%S")] * 10,
+                "id": np.arange(10, dtype=np.int32),
+                "value": np.random.default_rng().random(10, dtype=np.float32),
+                # One datetime64 array instead of a Python datetime per row
+                # Local time, matching connection_time
+                "timestamp": np.full(10, np.datetime64(datetime.now(), "s")),
             }
         )
 
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+import pandas as pd
+
+
+class TieredCache:
+    """Parquet-on-disk DataFrame cache, meant to sit behind ``st.cache_data``.
+
+    ``st.cache_data`` is the memory tier; ``get`` reads the Parquet file on a
+    warm hit and only calls the loader on a cold miss. The disk tier survives
+    process restarts and ``st.cache_data.clear()``, so drop it with ``clear``.
+    With ``max_age`` set, files older than that count as a miss and are
+    refetched, so a restart never serves stale data forever; each miss also
+    deletes expired files, which keeps the directory bounded.
+    """
+
+    def __init__(self, directory: Path, max_age: timedelta | None = None):
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+    def get(self, key: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the frame for ``key``, calling ``loader`` only on a cold miss"""
+        path = self._path(key)
+        if self._is_fresh(path):
+            return pd.read_parquet(path, engine="pyarrow")
+
+        df = loader()
+        try:
+            self._prune()
+            self._write(path, df)
+        except Exception:
+            # The load already succeeded; without the file the next start refetches
+            pass
+        return df
+
+    def _is_fresh(self, path: Path) -> bool:
+        """Whether ``path`` exists and is younger than ``max_age``"""
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if self.max_age is None:
+            return True
+        return time.time() - mtime < self.max_age.total_seconds()
+
+    def _prune(self):
+        """Delete expired files, including ones for keys no longer requested"""
+        if self.max_age is None:
+            return
+        for path in self.directory.glob("*.parquet"):
+            if not self._is_fresh(path):
+                path.unlink(missing_ok=True)
+
+    def _write(self, path: Path, df: pd.DataFrame):
+        """Write via a temp file and rename, so a crash never leaves half a file"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def clear(self):
+        """Delete every cached file"""
+        for path in self.directory.glob("*.parquet"):
+            path.unlink(missing_ok=True)
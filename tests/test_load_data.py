@@ -0,0 +1,48 @@
+import time
+from types import SimpleNamespace
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.caching import cache_utils
+from services import load_data, tiered_cache
+
+
+class FakeClock:
+    """Real clocks shifted by ``offset`` seconds"""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def monotonic(self):
+        return time.monotonic() + self.offset
+
+    def time(self):
+        return time.time() + self.offset
+
+
+def test_load_sample_data_refetches_after_ttl(monkeypatch, tmp_path):
+    clock = FakeClock()
+    # st.cache_data builds its storage with the timer on first use, so patch
+    # it and clear the caches before the first call
+    monkeypatch.setattr(cache_utils, "TTLCACHE_TIMER", clock.monotonic)
+    monkeypatch.setattr(tiered_cache, "time", SimpleNamespace(time=clock.time))
+    monkeypatch.setattr(load_data._SAMPLE_DATA_CACHE, "directory", tmp_path)
+    st.cache_data.clear()
+
+    fetches = []
+
+    def fake_fetch(url):
+        fetches.append(url)
+        return pd.DataFrame({"value": [1, 2, 3]})
+
+    monkeypatch.setattr(load_data, "_fetch_sample_data", fake_fetch)
+
+    load_data.load_sample_data("ttl_test.json")
+    load_data.load_sample_data("ttl_test.json")
+    assert len(fetches) == 1
+
+    clock.offset = load_data._SAMPLE_DATA_TTL.total_seconds() + 1
+    df = load_data.load_sample_data("ttl_test.json")
+    assert len(fetches) == 2
+    assert df["value"].tolist() == [1, 2, 3]
+
+    st.cache_data.clear()
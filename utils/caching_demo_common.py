@@ -0,0 +1,121 @@
+# Shared content for the caching demo pages
+
+# Code examples shown in the caching pages' expanders
+CACHING_EXAMPLES = {
+    "basic": """\
+import streamlit as st
+import time
+
+# Without caching - runs every time
+def slow_function_no_cache(n):
+    time.sleep(2)  # Simulate expensive operation
+    return sum(range(n))
+
+# With caching - runs once per unique input
+@st.cache_data
+def slow_function_cached(n):
+    time.sleep(2)  # Simulate expensive operation
+    return sum(range(n))
+
+# Usage
+result = slow_function_cached(1000)  # First call: takes 2 seconds
+result = slow_function_cached(1000)  # Subsequent calls: instant!
+""",
+    "disk_cache": """\
+import functools
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow.feather as feather
+
+
+def _key(args):
+    return hashlib.blake2b(repr(args).encode(), digest_size=8).hexdigest()
+
+
+def cached_feather(func):
+    # Cache a DataFrame-returning function as Arrow files on disk
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        os.makedirs(".cache", exist_ok=True)
+        path = f".cache/{func.__name__}_{_key((args, kwargs))}.feather"
+        if os.path.exists(path):
+            return feather.read_feather(path)
+        result = func(*args, **kwargs)
+        # Write to a temp file and rename, so a crash never leaves half a file
+        fd, tmp = tempfile.mkstemp(dir=".cache", suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(result, tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        return result
+
+    return wrapper
+
+
+@cached_feather
+def load_large_dataset(dataset_id):
+    return pd.read_csv(f"large_dataset_{dataset_id}.csv")
+""",
+    "config": """\
+@st.cache_data(
+    ttl=300,                    # Cache expires after 5 minutes
+    max_entries=10,             # Keep maximum 10 cache entries
+    show_spinner="Loading...",  # Custom loading message
+)
+def my_cached_function(param):
+    # Your expensive operation here
+    return result
+""",
+    "hash_funcs": """\
+@st.cache_resource
+def load_sales():
+    return pd.read_parquet("sales.parquet")  # same object on every call
+
+@st.cache_data(hash_funcs={pd.DataFrame: lambda df: id(df)})
+def summarize(df, metric):
+    return df[metric].describe()
+
+summary = summarize(load_sales(), "Sales")
+""",
+    "db_connection": """\
+@st.cache_resource
+def get_database_connection(connection_string):
+    # Connection created once and reused
+    conn = psycopg2.connect(connection_string)
+    return conn
+
+# Connection is established once
+db = get_database_connection("postgresql://localhost/mydb")
+result = db.execute("SELECT * FROM users")
+""",
+    "cache_management": """\
+# Clear all cache types
+st.cache_data.clear()     # Clear all @st.cache_data caches
+st.cache_resource.clear() # Clear all @st.cache_resource caches
+
+# Clear specific service function caches
+from services import byte_cache
+from services.load_data import generate_mockup_sales_data, load_sample_data
+from services.load_model import load_mock_model
+
+load_sample_data.clear()  # Clear specific data loading cache (incl. Parquet files)
+load_mock_model.clear()   # Clear specific model loading cache
+
+# byte_cached generators are outside st.cache_*, so clear them separately
+generate_mockup_sales_data.clear()  # One generator
+byte_cache.clear_all()              # Every byte_cached function
+
+# Programmatic cache invalidation
+@st.cache_data
+def get_user_data(user_id, _force_refresh=False):
+    if _force_refresh:
+        get_user_data.clear()  # Clear this function's cache
+    return load_user_data(user_id)
+""",
+}
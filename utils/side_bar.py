@@ -1,12 +1,114 @@
+import pandas as pd
 import streamlit as st
+from services import byte_cache
+from services.cache_stats import get_cache_stats
+
+_SIDEBAR_MD = """
+---
+
+### 🔗 Useful Links
+- [Streamlit Documentation](https://docs.streamlit.io)
+- [Streamlit Gallery](https://streamlit.io/gallery)
+- [API Reference](https://docs.streamlit.io/library/api-reference)
+"""
+
+
+def _debug_cache_stats():
+    """Raw counters from the service-level caches, as of the previous run"""
+    return {
+        "observed_cache": get_cache_stats(),
+        "byte_cached (bytes, hits, misses)": byte_cache.get_stats(),
+    }
 
 
 def add_sidebar_info():
     """Add common sidebar information to all pages"""
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### 🔗 Useful Links")
-    st.sidebar.markdown("""
-    - [Streamlit Documentation](https://docs.streamlit.io)
-    - [Streamlit Gallery](https://streamlit.io/gallery)
-    - [API Reference](https://docs.streamlit.io/library/api-reference)
-    """)
+    # Deliberately not an st.fragment: without widgets it would never rerun on
+    # its own, yet would still run on every full rerun, so it would skip nothing
+    sidebar = st.sidebar
+    sidebar.markdown(_SIDEBAR_MD)
+    # Open any page with ?debug=1 to check the caches are actually hitting
+    if st.query_params.get("debug") == "1":
+        sidebar.expander("🐞 Debug cache stats").write(_debug_cache_stats())
+
+
+def _collect_cache_stats():
+    """Gather per-function cache stats from st.cache_data and st.cache_resource"""
+    try:
+        # Hit/miss counters from the cache observability API
+        return [
+            {
+                "Function": s.function_name,
+                "Hits": s.hit_count,
+                "Misses": s.miss_count,
+                "Hit Ratio": s.hit_count / max(1, s.hit_count + s.miss_count),
+            }
+            for s in st.cache_data.get_stats() + st.cache_resource.get_stats()
+        ]
+    except AttributeError:
+        pass
+
+    # Streamlit without that API (including the pinned 1.45.1) only tracks
+    # memory usage, via the private runtime stats providers; their shape is
+    # not guaranteed, so callers must be ready for this to raise
+    from streamlit.runtime.caching import (
+        get_data_cache_stats_provider,
+        get_resource_cache_stats_provider,
+    )
+
+    providers = (get_data_cache_stats_provider(), get_resource_cache_stats_provider())
+    rows = []
+    for provider in providers:
+        stats = provider.get_stats()
+        # Newer providers group stats by metric family
+        if isinstance(stats, dict):
+            stats = [s for family in stats.values() for s in family]
+        rows.extend(
+            {
+                "Cache": s.category_name.removeprefix("st_"),
+                "Function": s.cache_name.rpartition(".")[2],
+                "Size (KB)": s.byte_length / 1024,
+            }
+            for s in stats
+        )
+    return rows
+
+
+def render_cache_stats():
+    """Show a live table of cache statistics in the sidebar"""
+    with st.sidebar.expander("📈 Cache Stats"):
+        # Sizing every cached entry walks its whole object graph, so only do it
+        # when asked; a collapsed expander still runs its body on every rerun
+        if not st.toggle("Collect cache stats", key="show_cache_stats"):
+            st.caption("Turn on to measure the caches on each rerun.")
+            return
+
+        service_stats = get_cache_stats()
+        if any(s["hits"] or s["misses"] for s in service_stats.values()):
+            st.markdown("**Service functions**")
+            st.dataframe(
+                pd.DataFrame(
+                    [
+                        {
+                            "Function": name,
+                            "Hits": s["hits"],
+                            "Misses": s["misses"],
+                            "Last (ms)": s["last_ms"],
+                            "Size (KB)": s["bytes"] / 1024,
+                        }
+                        for name, s in service_stats.items()
+                    ]
+                ),
+                hide_index=True,
+            )
+            st.markdown("**All cached functions**")
+
+        try:
+            rows = _collect_cache_stats()
+        except Exception:
+            st.caption("Cache stats are not available in this Streamlit version.")
+            return
+        if not rows:
+            st.caption("No cached entries yet.")
+            return
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
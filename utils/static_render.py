@@ -0,0 +1,19 @@
+import textwrap
+from functools import lru_cache
+
+import streamlit as st
+
+
+@lru_cache(maxsize=None)
+def _normalize_snippet(src: str) -> str:
+    """Dedent and trim a code snippet (computed once per unique snippet)"""
+    return textwrap.dedent(src).strip("\n")
+
+
+def render_code(src: str, language: str = "python"):
+    """Render a static code example.
+
+    Snippets are normalized once per process and reused on every rerun;
+    syntax highlighting itself happens in the browser.
+    """
+    st.code(_normalize_snippet(src), language=language)